@@ -104,5 +104,7 @@ class _Transformer(lark.Transformer[object, Angle]):
 
 AngleType: TypeAlias = Annotated[
     Angle,
-    parse.get_validator(grammar="angle.lark", transformer=_Transformer()),
+    parse.get_validator(
+        grammar="angle.lark", transformer=_Transformer(), cache=True
+    ),
 ]
@@ -3,14 +3,55 @@
 from __future__ import annotations
 
 import functools
+import re
 
 import pydantic
 import rfc3986
-from typing_extensions import Annotated, Self, TypeAlias, final, override
+from typing_extensions import (
+    Annotated,
+    Final,
+    Self,
+    TypeAlias,
+    TypeVar,
+    final,
+    override,
+)
 
 from svglab import models, protocols
 
 
+# local references whose fragment `rfc3986` would return unchanged
+_LOCAL_IRI_RE: Final = re.compile(r"#[A-Za-z0-9._:-]*")
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_iri(
+    iri: str, /
+) -> tuple[str | None, str | None, str | None, str | None, str | None]:
+    """Split an IRI into its components, caching the result.
+
+    Args:
+        iri: The IRI to split.
+
+    Returns:
+        A tuple of the scheme, authority, path, query and fragment.
+
+    Examples:
+    >>> _split_iri("https://example.com/a?b#c")
+    ('https', 'example.com', '/a', 'b', 'c')
+
+    """
+    parsed = rfc3986.iri_reference(iri)
+
+    return (
+        parsed.scheme,
+        parsed.authority,
+        parsed.path,
+        parsed.query,
+        parsed.fragment,
+    )
+
+
 @models.dataclass(
     frozen=True, kw_only=True, config=models.DATACLASS_CONFIG
 )
@@ -49,21 +90,21 @@ class Iri(protocols.CustomSerializable):
         document, for example, when using `url(#id)` in `fill` or `stroke`
         attributes.
         """
-        match self:
-            case Iri(
-                scheme=None,
-                authority=None,
-                path=None,
-                query=None,
-                fragment=fragment,
-            ) if fragment is not None:
-                return True
-            case _:
-                return False
+        return (
+            self.fragment is not None
+            and self.scheme is None
+            and self.authority is None
+            and self.path is None
+            and self.query is None
+        )
 
     @functools.cached_property
     def iri(self) -> str:
         """The full IRI as a string."""
+        # this is what `unsplit()` produces for a local reference
+        if self.is_local:
+            return f"#{self.fragment}"
+
         iri = rfc3986.IRIReference(
             scheme=self.scheme,
             authority=self.authority,
@@ -76,13 +117,7 @@ class Iri(protocols.CustomSerializable):
 
     def to_func_iri(self) -> FuncIri:
         """Convert this Iri to a FuncIri."""
-        return FuncIri(
-            scheme=self.scheme,
-            authority=self.authority,
-            path=self.path,
-            query=self.query,
-            fragment=self.fragment,
-        )
+        return _convert(self, FuncIri)
 
     @override
     def serialize(self) -> str:
@@ -102,15 +137,19 @@ class Iri(protocols.CustomSerializable):
             ValueError: If the IRI is invalid.
 
         """
+        # local references (`#id`) are by far the most common IRIs in SVG
+        if _LOCAL_IRI_RE.fullmatch(iri):
+            return cls(fragment=iri[1:])
+
         try:
-            parsed = rfc3986.iri_reference(iri)
+            scheme, authority, path, query, fragment = _split_iri(iri)
 
             return cls(
-                scheme=parsed.scheme,
-                authority=parsed.authority,
-                path=parsed.path,
-                query=parsed.query,
-                fragment=parsed.fragment,
+                scheme=scheme,
+                authority=authority,
+                path=path,
+                query=query,
+                fragment=fragment,
             )
 
         except Exception as e:
@@ -134,13 +173,7 @@ class FuncIri(Iri):
 
     def to_iri(self) -> Iri:
         """Convert this FuncIri to an Iri."""
-        return Iri(
-            scheme=self.scheme,
-            authority=self.authority,
-            path=self.path,
-            query=self.query,
-            fragment=self.fragment,
-        )
+        return _convert(self, Iri)
 
     @override
     def serialize(self) -> str:
@@ -159,6 +192,37 @@ class FuncIri(Iri):
         return super().from_str(iri)
 
 
+_IriT = TypeVar("_IriT", bound=Iri)
+
+
+def _convert(iri: Iri, cls: type[_IriT], /) -> _IriT:
+    """Copy the components of an IRI into an instance of another IRI class.
+
+    The components have already been validated, so the new instance is
+    created without going through Pydantic.
+
+    Args:
+        iri: The IRI to copy the components from.
+        cls: The class of the new instance.
+
+    Returns:
+        The new instance.
+
+    Examples:
+    >>> _convert(Iri(fragment="a"), FuncIri)
+    FuncIri(scheme=None, authority=None, path=None, query=None, fragment='a')
+
+    """
+    result = cls.__new__(cls)
+    object.__setattr__(result, "scheme", iri.scheme)
+    object.__setattr__(result, "authority", iri.authority)
+    object.__setattr__(result, "path", iri.path)
+    object.__setattr__(result, "query", iri.query)
+    object.__setattr__(result, "fragment", iri.fragment)
+
+    return result
+
+
 IriType: TypeAlias = Annotated[
     Iri,
     pydantic.BeforeValidator(
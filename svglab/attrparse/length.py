@@ -6,17 +6,19 @@ Use `Length` to represent lengths in SVG. Use `LengthType` in Pydantic fields.
 from __future__ import annotations
 
 import contextlib
-from collections.abc import Iterator
+import functools
+import math
+import re
 
 import lark
-import more_itertools
+import typing_extensions
 from typing_extensions import (
     Annotated,
     Final,
-    Literal,
     Self,
     SupportsFloat,
     TypeAlias,
+    cast,
     final,
     override,
 )
@@ -47,14 +49,26 @@ _convert: Final[units.Converter[Length, utiltypes.LengthUnit]] = (
 )
 
 
-@final
+_LENGTH_UNITS: Final[frozenset[str]] = frozenset(
+    typing_extensions.get_args(
+        typing_extensions.get_args(utiltypes.LengthUnit)[0]
+    )
+)
+
+
 @models.dataclass(frozen=True, config=models.DATACLASS_CONFIG)
-class Length(
+class _Length(
     mixins.AddSub["Length"],
     mixins.FloatMulDiv,
     SupportsFloat,
     protocols.CustomSerializable,
 ):
+    value: float
+    unit: utiltypes.LengthUnit = None
+
+
+@final
+class Length(_Length):
     """Represents the SVG `<length>` type.
 
     A length is a number optionally followed by a unit. Available units are:
@@ -79,8 +93,20 @@ class Length(
 
     """
 
-    value: float
-    unit: utiltypes.LengthUnit = None
+    @override
+    def __init__(
+        self, value: float, unit: utiltypes.LengthUnit = None
+    ) -> None:
+        # with a plain number and a known unit, Pydantic's validation is a
+        # no-op, so the fields are set directly, like in `Point`; lengths are
+        # created for most attribute values and for every conversion
+        if type(value) in (float, int) and (
+            unit is None or (type(unit) is str and unit in _LENGTH_UNITS)
+        ):
+            object.__setattr__(self, "value", float(value))
+            object.__setattr__(self, "unit", unit)
+        else:
+            super().__init__(value, unit)
 
     def to(self, unit: utiltypes.LengthUnit) -> Length:
         """Convert the length to a different unit.
@@ -105,18 +131,25 @@ class Length(
     @override
     def serialize(self) -> str:
         formatter = serialize.get_current_formatter()
-        units: Iterator[utiltypes.LengthUnit | Literal["preserve"]] = (
-            more_itertools.always_iterable(formatter.length_unit)
-        )
+        length_unit = formatter.length_unit
         converted = self
 
-        for unit in units:
-            if unit == "preserve":
-                break
-
+        # a single unit (or none at all) is by far the most common setting,
+        # so it is handled without setting up a loop; like an empty list of
+        # units, `None` keeps the original unit
+        if length_unit is None or length_unit == "preserve":
+            pass
+        elif isinstance(length_unit, str):
             with contextlib.suppress(errors.SvgUnitConversionError):
-                converted = self.to(unit)
-                break
+                converted = self.to(length_unit)
+        else:
+            for unit in length_unit:
+                if unit == "preserve":
+                    break
+
+                with contextlib.suppress(errors.SvgUnitConversionError):
+                    converted = self.to(unit)
+                    break
 
         value = serialize.serialize(
             converted.value, precision_group="coordinate"
@@ -125,8 +158,10 @@ class Length(
         return f"{value}{converted.unit or ''}"
 
     @classmethod
-    def zero(cls) -> Length:
+    @functools.cache
+    def zero(cls) -> Self:
         """Return a length of zero."""
+        # lengths are immutable, so a single instance can be shared
         return cls(0)
 
     @override
@@ -153,7 +188,52 @@ class _Transformer(lark.Transformer[object, Length]):
     length = Length
 
 
+# the same language as `length.lark`
+_LENGTH_RE: Final = re.compile(
+    r"[ \t\f\r\n]*"
+    r"([+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[eE][+-]?[0-9]+)?)"
+    r"[ \t\f\r\n]*"
+    r"(%|ch|cm|em|ex|in|mm|pc|pt|px|Q|rem|vh|vmax|vmin|vw)?"
+    r"[ \t\f\r\n]*"
+)
+
+
+def _scan(text: str) -> Length | None:
+    """Parse a length without going through the grammar.
+
+    Args:
+        text: The text to parse.
+
+    Returns:
+        The parsed length, or `None` if the text is not a valid length or
+        its value is not finite.
+
+    Examples:
+    >>> _scan(" 10.5px")
+    Length(value=10.5, unit='px')
+    >>> _scan("1e999") is None
+    True
+
+    """
+    match = _LENGTH_RE.fullmatch(text)
+
+    if match is None:
+        return None
+
+    value = float(match[1])
+
+    if not math.isfinite(value):
+        return None
+
+    return Length(value, cast(utiltypes.LengthUnit, match[2]))
+
+
 LengthType: TypeAlias = Annotated[
     Length,
-    parse.get_validator(grammar="length.lark", transformer=_Transformer()),
+    parse.get_validator(
+        grammar="length.lark",
+        transformer=_Transformer(),
+        cache=True,
+        fast_path=_scan,
+    ),
 ]
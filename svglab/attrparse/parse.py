@@ -6,6 +6,7 @@ import math
 import os
 import pathlib
 import sys
+from collections.abc import Callable
 
 import lark
 import pydantic
@@ -32,6 +33,7 @@ _ConvertibleToFloat: TypeAlias = (
 )
 
 
+_CACHE_SIZE: Final = 4096
 _CURRENT_DIR: Final = pathlib.Path(__file__).parent
 _GRAMMARS_DIR: Final = _CURRENT_DIR / "grammars"
 
@@ -58,6 +60,7 @@ def _get_parser(*, grammar: LiteralString) -> lark.Lark:
         maybe_placeholders=False,
         ordered_sets=False,
         parser="lalr",
+        lexer="contextual",
         propagate_positions=False,
     )
 
@@ -98,6 +101,8 @@ def get_validator(
     *,
     grammar: LiteralString,
     transformer: lark.Transformer[_LeafT, _ReturnT],
+    cache: bool = False,
+    fast_path: Callable[[str], _ReturnT | None] | None = None,
     **kwargs: object,
 ) -> pydantic.BeforeValidator:
     """Get a Pydantic BeforeValidator for parsing with Lark.
@@ -106,6 +111,13 @@ def get_validator(
         grammar: The name of the grammar file.
         transformer: A Lark transformer to use for transforming the parse tree.
             The transformer must be a subclass of `lark.Transformer`.
+        cache: Whether to cache the parsed values. Attribute values repeat a
+            lot within a document, but a cached value is shared by all
+            equal inputs, so this must only be used if the transformer
+            produces immutable values.
+        fast_path: A function that parses common inputs without going
+            through the grammar. It must return `None` for any input it does
+            not handle, which is then parsed with the grammar instead.
         **kwargs: Additional keyword arguments to pass to the parser.
 
     Returns:
@@ -122,11 +134,26 @@ def get_validator(
         msg = f"Cannot read grammar file: {grammar_path}"
         raise ValueError(msg)
 
+    def parse_value(text: str) -> _ReturnT:
+        if (
+            fast_path is not None
+            and (result := fast_path(text)) is not None
+        ):
+            return result
+
+        return parse(
+            text, grammar=grammar, transformer=transformer, **kwargs
+        )
+
+    parse_function: Callable[[str], _ReturnT] = (
+        functools.lru_cache(maxsize=_CACHE_SIZE)(parse_value)
+        if cache
+        else parse_value
+    )
+
     def validator(value: object) -> object:
         if isinstance(value, str):
-            return parse(
-                value, grammar=grammar, transformer=transformer, **kwargs
-            )
+            return parse_function(value)
 
         return value
 
@@ -2,15 +2,32 @@
 
 Use `PathData` to represent path data in SVG. Use `PathDataType` in Pydantic
 fields.
+
+Path commands are plain dataclasses and do not validate or convert their
+arguments: points must be `Point` instances, numbers must be floats and
+flags must be booleans. Parsed path data and the `PathData` builder
+methods (`line_to()`, `arc_to()`, ...) always produce valid commands; code
+that creates commands directly is responsible for passing the right types.
 """
 
 from __future__ import annotations
 
 import abc
 import contextlib
-from collections.abc import Generator, Iterable, MutableSequence
+import dataclasses
+import functools
+import math
+import re
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    MutableSequence,
+    Sequence,
+)
 
 import lark
+import numpy as np
 import pydantic_core
 from typing_extensions import (
     Annotated,
@@ -20,27 +37,32 @@ from typing_extensions import (
     Self,
     SupportsIndex,
     TypeAlias,
+    TypeIs,
+    TypeVar,
+    cast,
     final,
     overload,
     override,
     runtime_checkable,
 )
 
-from svglab import errors, mixins, models, protocols, serialize
+from svglab import errors, mixins, protocols, serialize
 from svglab.attrparse import parse, point, transform
-from svglab.utils import iterutils, miscutils
+from svglab.utils import iterutils
 
 
 _Flag: TypeAlias = Literal["0", "1"]
+_T = TypeVar("_T")
 
 
-@models.dataclass(config=models.DATACLASS_CONFIG)
 class _PathCommandBase:
-    pass
+    __slots__ = ()
 
 
 @runtime_checkable
 class _HasEnd(Protocol):
+    __slots__ = ()
+
     end: point.Point
 
 
@@ -49,11 +71,25 @@ class _PhysicalPathCommand(
     transform.PointAddSubWithTranslateRMatmul,
     metaclass=abc.ABCMeta,
 ):
-    pass
+    __slots__ = ()
+
+
+class _PointPathCommand(_PhysicalPathCommand):
+    """Base for path commands whose fields are all points."""
+
+    __slots__ = ()
+
+    def __rmatmul__(self, other: transform.TransformFunction) -> Self:
+        return type(self)(
+            *(
+                other @ getattr(self, name)
+                for name in _POINT_FIELDS[type(self)]
+            )
+        )
 
 
 @final
-@models.dataclass(config=models.DATACLASS_CONFIG)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ClosePath(_PathCommandBase):
     """Close the current subpath (Z).
 
@@ -63,20 +99,23 @@ class ClosePath(_PathCommandBase):
     """
 
 
-@models.dataclass(config=models.DATACLASS_CONFIG)
-class LineTo(_HasEnd, _PhysicalPathCommand):
-    """Draw a line from the current point to the given end point (L)."""
+@dataclasses.dataclass(frozen=True, slots=True)
+class LineTo(_HasEnd, _PointPathCommand):
+    """Draw a line from the current point to the given end point (L).
 
-    end: point.Point
+    The end point must be a `Point`; it is not validated.
+    """
 
-    def __rmatmul__(self, other: transform.TransformFunction) -> Self:
-        return type(self)(end=other @ self.end)
+    end: point.Point
 
 
 @final
-@models.dataclass(config=models.DATACLASS_CONFIG)
+@dataclasses.dataclass(frozen=True, slots=True)
 class HorizontalLineTo(_PhysicalPathCommand):
-    """Draw a horizontal line from the current point (H)."""
+    """Draw a horizontal line from the current point (H).
+
+    `x` must be a float; it is neither validated nor converted.
+    """
 
     x: float
 
@@ -105,9 +144,12 @@ class HorizontalLineTo(_PhysicalPathCommand):
 
 
 @final
-@models.dataclass(config=models.DATACLASS_CONFIG)
+@dataclasses.dataclass(frozen=True, slots=True)
 class VerticalLineTo(_PhysicalPathCommand):
-    """Draw a vertical line from the current point (V)."""
+    """Draw a vertical line from the current point (V).
+
+    `y` must be a float; it is neither validated nor converted.
+    """
 
     y: float
 
@@ -136,93 +178,79 @@ class VerticalLineTo(_PhysicalPathCommand):
 
 
 @final
-@models.dataclass(config=models.DATACLASS_CONFIG)
-class SmoothQuadraticBezierTo(_HasEnd, _PhysicalPathCommand):
+@dataclasses.dataclass(frozen=True, slots=True)
+class SmoothQuadraticBezierTo(_HasEnd, _PointPathCommand):
     """Draw a smooth/shorthand quadratic Bézier curve (T).
 
     The curve is drawn from the current point to the end point. The control
     point is calculated based on the previous command as a reflection of the
     previous control point across the end point of the previous command.
+
+    The end point must be a `Point`; it is not validated.
     """
 
     end: point.Point
 
-    def __rmatmul__(self, other: transform.TransformFunction) -> Self:
-        return type(self)(end=other @ self.end)
-
 
 @final
-@models.dataclass(config=models.DATACLASS_CONFIG)
-class SmoothCubicBezierTo(_HasEnd, _PhysicalPathCommand):
+@dataclasses.dataclass(frozen=True, slots=True)
+class SmoothCubicBezierTo(_HasEnd, _PointPathCommand):
     """Draw a smooth/shorthand cubic Bézier curve (S).
 
     The curve is drawn from the current point to the end point. The first
     control point is calculated based on the previous command as a reflection
     of the second control point of the previous command across the end point
     of the previous command. The second control point is given as an argument.
+
+    Both points must be `Point` instances; they are not validated.
     """
 
     control2: point.Point
     end: point.Point
 
-    def __rmatmul__(self, other: transform.TransformFunction) -> Self:
-        return type(self)(
-            control2=other @ self.control2, end=other @ self.end
-        )
-
 
 @final
-@models.dataclass(config=models.DATACLASS_CONFIG)
-class MoveTo(_HasEnd, _PhysicalPathCommand):
-    """Move the current point to the end point and start a new subpath (M)."""
+@dataclasses.dataclass(frozen=True, slots=True)
+class MoveTo(_HasEnd, _PointPathCommand):
+    """Move the current point to the end point and start a new subpath (M).
 
-    end: point.Point
+    The end point must be a `Point`; it is not validated.
+    """
 
-    def __rmatmul__(self, other: transform.TransformFunction) -> Self:
-        return type(self)(end=other @ self.end)
+    end: point.Point
 
 
 @final
-@models.dataclass(config=models.DATACLASS_CONFIG)
-class QuadraticBezierTo(_HasEnd, _PhysicalPathCommand):
+@dataclasses.dataclass(frozen=True, slots=True)
+class QuadraticBezierTo(_HasEnd, _PointPathCommand):
     """Draw a quadratic Bézier curve (Q).
 
     The curve is drawn from the current point to the end point using `control`
-    as the control point.
+    as the control point. Both points must be `Point` instances; they are not
+    validated.
     """
 
     control: point.Point
     end: point.Point
 
-    def __rmatmul__(self, other: transform.TransformFunction) -> Self:
-        return type(self)(
-            control=other @ self.control, end=other @ self.end
-        )
-
 
 @final
-@models.dataclass(config=models.DATACLASS_CONFIG)
-class CubicBezierTo(_HasEnd, _PhysicalPathCommand):
+@dataclasses.dataclass(frozen=True, slots=True)
+class CubicBezierTo(_HasEnd, _PointPathCommand):
     """Draw a cubic Bézier curve (C).
 
     The curve is drawn from the current point to the end point using
-    `control1` and `control2` as the control points.
+    `control1` and `control2` as the control points. All points must be
+    `Point` instances; they are not validated.
     """
 
     control1: point.Point
     control2: point.Point
     end: point.Point
 
-    def __rmatmul__(self, other: transform.TransformFunction) -> Self:
-        return type(self)(
-            control1=other @ self.control1,
-            control2=other @ self.control2,
-            end=other @ self.end,
-        )
-
 
 @final
-@models.dataclass(config=models.DATACLASS_CONFIG)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ArcTo(_HasEnd, _PhysicalPathCommand):
     """Draw an elliptical arc (A).
 
@@ -233,6 +261,9 @@ class ArcTo(_HasEnd, _PhysicalPathCommand):
     - `large`: A flag indicating whether the arc is large or small.
     - `sweep`: A flag indicating whether the arc is drawn in a positive or
     negative angle direction.
+
+    The arguments are neither validated nor converted: `radii` and `end` must
+    be `Point` instances, `angle` a float and the flags booleans.
     """
 
     radii: point.Point
@@ -281,6 +312,99 @@ PathCommand: TypeAlias = (
 )
 
 
+class _CommandTable(dict[type[_PathCommandBase], _T]):
+    """A table keyed by path command class which also covers subclasses.
+
+    Lookups are by exact type, which is fast. `LineTo` is the only command
+    class that is not final; a subclass missing from the table gets the entry
+    of its closest base class, which is then stored for later lookups. Only
+    indexing falls back to the base classes, `get()` and `in` do not.
+
+    """
+
+    def __missing__(self, key: type[_PathCommandBase]) -> _T:
+        for base in key.__mro__[1:]:
+            if base in self:
+                value = self[key] = self[base]
+                return value
+
+        raise KeyError(key)
+
+
+_POINT_FIELDS: Final[_CommandTable[tuple[str, ...]]] = _CommandTable(
+    {
+        cls: tuple(field.name for field in dataclasses.fields(cls))
+        for cls in (
+            CubicBezierTo,
+            LineTo,
+            MoveTo,
+            QuadraticBezierTo,
+            SmoothCubicBezierTo,
+            SmoothQuadraticBezierTo,
+        )
+    }
+)
+"""Field names of path commands whose fields are all points."""
+
+_COMMAND_SERIALIZATION: Final[
+    _CommandTable[
+        tuple[
+            Literal["M", "L", "H", "V", "C", "S", "Q", "T", "A", "Z"],
+            tuple[str, ...],
+        ]
+    ]
+] = _CommandTable(
+    {
+        MoveTo: ("M", ("end",)),
+        LineTo: ("L", ("end",)),
+        HorizontalLineTo: ("H", ("x",)),
+        VerticalLineTo: ("V", ("y",)),
+        CubicBezierTo: ("C", ("control1", "control2", "end")),
+        SmoothCubicBezierTo: ("S", ("control2", "end")),
+        QuadraticBezierTo: ("Q", ("control", "end")),
+        SmoothQuadraticBezierTo: ("T", ("end",)),
+        ArcTo: ("A", ("radii", "angle", "large", "sweep", "end")),
+        ClosePath: ("Z", ()),
+    }
+)
+"""Command characters and serialized field names of path commands."""
+
+
+def _transform_points(
+    transform_function: transform.TransformFunction,
+    points: Sequence[point.Point],
+) -> list[point.Point]:
+    """Apply a transformation to multiple points at once.
+
+    This is equivalent to `[transform_function @ p for p in points]`, but
+    the transformation matrix is only computed once and all points are
+    transformed in a single matrix product.
+
+    Args:
+        transform_function: The transformation to apply.
+        points: The points to transform.
+
+    Returns:
+        A list of the transformed points.
+
+    Examples:
+    >>> _transform_points(
+    ...     transform.Translate(1, 2),
+    ...     [point.Point(0, 0), point.Point(1, 1)],
+    ... )
+    [Point(x=1.0, y=2.0), Point(x=2.0, y=3.0)]
+
+    """
+    if not points:
+        return []
+
+    matrix = np.array(transform_function)
+    coords = np.array([(p.x, p.y) for p in points])
+    transformed = coords @ matrix[:2, :2].T + matrix[:2, 2]
+
+    return [point.Point(x, y) for x, y in transformed.tolist()]
+
+
 def _get_latest_moveto(path_data: PathData, max_idx: int) -> MoveTo:
     for i in range(max_idx, -1, -1):
         cmd = path_data[i]
@@ -314,139 +438,146 @@ def _get_end_at(path_data: PathData, idx: int) -> point.Point:
     Point(x=100.0, y=10.0)
 
     """
-    command = path_data[idx]
-
-    match command:
-        case ClosePath():
-            last_moveto = _get_latest_moveto(path_data, idx)
-            return last_moveto.end
-        case HorizontalLineTo(x=x):
-            end = _get_end_at(path_data, idx - 1)
-            return point.Point(x, end.y)
-        case VerticalLineTo(y=y):
-            end = _get_end_at(path_data, idx - 1)
-            return point.Point(end.x, y)
-        case _:
-            return command.end
-
-
-def _quadratic_control_at(path_data: PathData, idx: int) -> point.Point:
-    """Compute the control point for a smooth quadratic Bézier command (`T`).
-
-    The control point is calculated based on the previous command. If the
-    previous command is a quadratic Bézier command (`Q`), the control point
-    is the reflection of the previous control point across the end point of
-    the previous command. If the previous command is of any other type, the
-    control point is coincident with the end point of the previous command.
-
-    Args:
-        path_data: The path containing the command.
-        idx: The index of the smooth quadratic Bézier command.
-
-    Returns:
-        The control point for the command.
-
-    Raises:
-        ValueError: If the command has no predecessor.
-
-    Examples:
-    >>> path_data = PathData.from_str("M 0,0 Q 20,0 20,20 T 40,40")
-    >>> _quadratic_control_at(path_data, 2)
-    Point(x=20.0, y=40.0)
-
-    """
-    if idx == 0:
-        msg = f"Item {path_data[idx]!r} has no predecessor."
+    # walk backwards to the nearest command with a known end point, collecting
+    # coordinates set by `H`/`V` along the way; this avoids recursing once per
+    # command on long chains of shorthand lines
+    x: float | None = None
+    y: float | None = None
+
+    # normalize negative indices and raise `IndexError` if out of range
+    idx = range(len(path_data))[idx]
+
+    for i in range(idx, -1, -1):
+        command = path_data[i]
+
+        if type(command) is HorizontalLineTo:
+            x = command.x if x is None else x
+        elif type(command) is VerticalLineTo:
+            y = command.y if y is None else y
+        elif type(command) is ClosePath:
+            end = _get_latest_moveto(path_data, i).end
+            break
+        else:
+            end = command.end
+            break
+    else:
+        msg = f"Cannot determine end point ({idx=})"
         raise ValueError(msg)
 
-    prev = path_data[idx - 1]
-    end = _get_end_at(path_data, idx - 1)
+    if x is None and y is None:
+        return end
 
-    match prev:
-        case QuadraticBezierTo(control=control):
-            pass
-        case SmoothQuadraticBezierTo():
-            control = _quadratic_control_at(path_data, idx - 1)
-        case _:
-            return end
+    return point.Point(
+        end.x if x is None else x, end.y if y is None else y
+    )
 
-    return control.line_reflect(end)
 
+def _advance(
+    command: PathCommand, pos: point.Point, subpath_start: point.Point
+) -> tuple[point.Point, point.Point]:
+    """Advance the current point of a path by a single absolute command.
 
-def _cubic_control_at(path_data: PathData, idx: int) -> point.Point:
-    """Compute the first control point for a smooth cubic Bézier command (`S`).
+    Args:
+        command: The command to advance by.
+        pos: The current point before the command.
+        subpath_start: The start of the current subpath before the command.
 
-    The control point is calculated based on the previous command. If the
-    previous command is a cubic Bézier command (`C`), the control point is the
-    reflection of the second control point of the previous command across the
-    end point of the previous command. If the previous command is of any other
-    type, the control point is coincident with the end point of the previous
-    command.
+    Returns:
+        A tuple of the current point and the start of the current subpath
+        after the command.
+
+    """
+    # `isinstance()` is slow for classes with protocols among their bases,
+    # so commands are checked by exact type; every command class except
+    # `LineTo` is final, and `LineTo` subclasses are handled by
+    # `_is_line_to()` or the fallback of `_CommandTable` (here, they fall
+    # through to the default case, like `LineTo` itself)
+    if type(command) is ClosePath:
+        return subpath_start, subpath_start
+    if type(command) is HorizontalLineTo:
+        return point.Point(command.x, pos.y), subpath_start
+    if type(command) is VerticalLineTo:
+        return point.Point(pos.x, command.y), subpath_start
+    if type(command) is MoveTo:
+        return command.end, command.end
+
+    return command.end, subpath_start
+
+
+def _next_smooth_controls(
+    command: PathCommand, end: point.Point, quadratic: point.Point
+) -> tuple[point.Point, point.Point]:
+    """Compute the implied control points of a smooth curve after a command.
+
+    A smooth quadratic Bézier command (`T`) uses the reflection of the
+    previous control point across the current point if the previous command
+    is a quadratic Bézier command (`Q` or `T`). Similarly, a smooth cubic
+    Bézier command (`S`) uses the reflection of the second control point of
+    the previous command if it is a cubic Bézier command (`C` or `S`). In all
+    other cases, the control point is coincident with the current point.
+
+    Carrying the result from command to command computes the control points
+    of a whole path in a single forward pass. The second control point of an
+    `S` command is given explicitly, so only `T` needs the previous state.
 
     Args:
-        path_data: The path containing the command.
-        idx: The index of the smooth cubic Bézier command.
+        command: The (absolute) command.
+        end: The end point of the command.
+        quadratic: The control point of a `T` command in place of `command`.
 
     Returns:
-        The first control point for the command.
-
-    Raises:
-        ValueError: If the command has no predecessor.
+        A tuple of the control point of a `T` command and the first control
+        point of an `S` command following `command`.
 
     Examples:
-    >>> path_data = PathData.from_str(
-    ...     "M 0,0 C 20,0 20,20 40,40 S 100,100 50,50"
+    >>> origin = point.Point.zero()
+    >>> _next_smooth_controls(
+    ...     QuadraticBezierTo(point.Point(20, 0), point.Point(20, 20)),
+    ...     point.Point(20, 20),
+    ...     origin,
+    ... )
+    (Point(x=20.0, y=40.0), Point(x=20.0, y=20.0))
+    >>> _next_smooth_controls(
+    ...     LineTo(point.Point(10, 10)), point.Point(10, 10), origin
     ... )
-    >>> _cubic_control_at(path_data, 2)
-    Point(x=60.0, y=60.0)
+    (Point(x=10.0, y=10.0), Point(x=10.0, y=10.0))
 
     """
-    if idx == 0:
-        msg = f"Item {path_data[idx]!r} has no predecessor."
-        raise ValueError(msg)
-
-    prev = path_data[idx - 1]
-    end = _get_end_at(path_data, idx - 1)
-
-    if isinstance(prev, CubicBezierTo | SmoothCubicBezierTo):
-        return prev.control2.line_reflect(end)
+    # exact type checks, see `_advance()`
+    if type(command) is QuadraticBezierTo:
+        return command.control.line_reflect(end), end
+    if type(command) is SmoothQuadraticBezierTo:
+        return quadratic.line_reflect(end), end
+    if (
+        type(command) is CubicBezierTo
+        or type(command) is SmoothCubicBezierTo
+    ):
+        return end, command.control2.line_reflect(end)
 
-    return end
+    return end, end
 
 
-def _relativize(path_data: PathData) -> PathData:
-    """Recompute the coordinates of path commands as if they were relative.
+def _is_line_to(command: PathCommand, /) -> TypeIs[LineTo]:
+    """Determine whether a command is a `LineTo` command.
 
-    This function takes a path and recomputes the coordinates of the path
-    commands as if they were relative. This is done by subtracting the
-    current position from the coordinates of each command. The resulting path
-    may be used for serialization with relative coordinates.
+    `LineTo` is the only command class that is not final. This check looks
+    the command up in `_COMMAND_SERIALIZATION`, which covers subclasses,
+    instead of using a slow `isinstance()`.
 
     Args:
-        path_data: The path to relativize.
+        command: The command to check.
 
     Returns:
-        A new `PathData` instance with the coordinates of the path commands
-        recomputed as if they were relative.
+        `True` if the command is a `LineTo` or a subclass of it.
 
     Examples:
-    >>> path_data = PathData.from_str("M 10,10")
-    >>> _relativize(path_data)
-    PathData(MoveTo(end=Point(x=10.0, y=10.0)))
+    >>> _is_line_to(LineTo(point.Point(1, 1)))
+    True
+    >>> _is_line_to(MoveTo(point.Point(1, 1)))
+    False
 
     """
-    result = PathData()
-    pos = point.Point.zero()
-
-    for i, command in enumerate(path_data):
-        if isinstance(command, _PhysicalPathCommand):
-            result.append(command - pos)
-        else:
-            result.append(command)
-
-        pos = _get_end_at(path_data, i)
-
-    return result
+    return _COMMAND_SERIALIZATION[type(command)][0] == "L"
 
 
 def _can_use_implicit_command(
@@ -478,8 +609,9 @@ def _can_use_implicit_command(
     True
 
     """
+    # exact type checks, see `_advance()`
     return type(prev) is type(current) or (
-        isinstance(prev, MoveTo) and isinstance(current, LineTo)
+        type(prev) is MoveTo and _is_line_to(current)
     )
 
 
@@ -533,6 +665,8 @@ class PathData(
 
     """
 
+    __slots__ = ("__commands",)
+
     def __add(
         self, command: PathCommand, /, *, relative: bool = False
     ) -> Self:
@@ -557,13 +691,17 @@ class PathData(
             "pen" to the starting point.
 
         """
-        self.__commands: Final[list[PathCommand]] = []
+        commands = list(iterable)
 
         if start is not None:
-            self.move_to(start)
+            commands.insert(0, MoveTo(end=start))
 
-        for command in iterable:
-            self.__add(command)
+        # only the first command can violate the MoveTo invariant, so the
+        # whole list is checked once instead of on every insertion
+        if commands and not isinstance(commands[0], MoveTo):
+            raise errors.SvgPathMissingMoveToError
+
+        self.__commands: Final[list[PathCommand]] = commands
 
     @override
     def insert(self, index: SupportsIndex, value: PathCommand) -> None:
@@ -574,6 +712,34 @@ class PathData(
 
         self.__commands.insert(index, value)
 
+    # the following methods are provided by `MutableSequence`, but its
+    # generic implementations go through `__getitem__()` and `insert()` for
+    # every element; they are forwarded to the underlying list instead
+
+    @override
+    def append(self, value: PathCommand) -> None:
+        if not self.__commands and not isinstance(value, MoveTo):
+            raise errors.SvgPathMissingMoveToError
+
+        self.__commands.append(value)
+
+    @override
+    def extend(self, values: Iterable[PathCommand]) -> None:
+        commands = list(values)
+
+        if (
+            commands
+            and not self.__commands
+            and not isinstance(commands[0], MoveTo)
+        ):
+            raise errors.SvgPathMissingMoveToError
+
+        self.__commands.extend(commands)
+
+    @override
+    def count(self, value: PathCommand) -> int:
+        return self.__commands.count(value)
+
     def move_to(
         self, end: point.Point, /, *, relative: bool = False
     ) -> Self:
@@ -732,7 +898,11 @@ class PathData(
         """
         return self.__add(
             ArcTo(
-                radii=radii, angle=angle, large=large, sweep=sweep, end=end
+                radii=radii,
+                angle=float(angle),
+                large=large,
+                sweep=sweep,
+                end=end,
             ),
             relative=relative,
         )
@@ -823,14 +993,8 @@ class PathData(
             PathData(MoveTo(end=Point(x=10.0, y=10.0)), ClosePath())
 
         """
-        path_data = parse.parse(
-            text, grammar="path_data.lark", transformer=_Transformer()
-        )
-
-        assert isinstance(path_data, cls), (
-            f"Expected {cls}, got {type(path_data)}"
-        )
-        return path_data
+        # the parsed commands are shared, but every call gets its own path
+        return cls(_parse_commands(text))
 
     @classmethod
     def _validate(
@@ -838,6 +1002,11 @@ class PathData(
     ) -> PathData:
         del info
 
+        # exact-type check first; a class pattern on a protocol class goes
+        # through the slow Python-level __instancecheck__
+        if type(value) is cls:
+            return value
+
         match value:
             case str():
                 return cls.from_str(value)
@@ -867,74 +1036,46 @@ class PathData(
 
         return path_data
 
-    def __serialize_commands(self) -> Generator[str]:
+    @override
+    def serialize(self) -> str:
         formatter = serialize.get_current_formatter()
         path_data = self.__apply_shorthand_formatting()
+        relative = formatter.path_data_coordinates == "relative"
+        allow_implicit = formatter.path_data_commands == "implicit"
 
-        if formatter.path_data_coordinates == "relative":
-            path_data = _relativize(path_data)
+        parts: list[str] = []
+        prev: PathCommand | None = None
+        # the current point is only tracked for relative coordinates, which
+        # are computed on the fly instead of building a relativized copy
+        pos = subpath_start = point.Point.zero()
 
-        for prev, command in iterutils.pairwise(path_data):
-            implicit = (
-                formatter.path_data_commands == "implicit"
-                and _can_use_implicit_command(command, prev=prev)
-            )
+        for command in path_data:
+            args = command
 
-            match command:
-                case MoveTo(end):
-                    yield serialize.serialize_path_command(
-                        end, char="M", implicit=implicit
-                    )
-                case LineTo(end):
-                    yield serialize.serialize_path_command(
-                        end, char="L", implicit=implicit
-                    )
-                case HorizontalLineTo(x):
-                    yield serialize.serialize_path_command(
-                        x, char="H", implicit=implicit
-                    )
-                case VerticalLineTo(y):
-                    yield serialize.serialize_path_command(
-                        y, char="V", implicit=implicit
-                    )
-                case QuadraticBezierTo(control, end):
-                    yield serialize.serialize_path_command(
-                        control, end, char="Q", implicit=implicit
-                    )
-                case SmoothQuadraticBezierTo(end):
-                    yield serialize.serialize_path_command(
-                        end, char="T", implicit=implicit
-                    )
-                case CubicBezierTo(control1, control2, end):
-                    yield serialize.serialize_path_command(
-                        control1,
-                        control2,
-                        end,
-                        char="C",
-                        implicit=implicit,
-                    )
-                case SmoothCubicBezierTo(control2, end):
-                    yield serialize.serialize_path_command(
-                        control2, end, char="S", implicit=implicit
-                    )
-                case ArcTo(radii, angle, large, sweep, end):
-                    yield serialize.serialize_path_command(
-                        radii,
-                        angle,
-                        large,
-                        sweep,
-                        end,
-                        char="A",
-                        implicit=implicit,
-                    )
-                case ClosePath():
-                    yield serialize.serialize_path_command(
-                        char="Z", implicit=implicit
-                    )
+            if relative:
+                # `ClosePath` is the only non-physical command (exact type
+                # check, see `_advance()`)
+                if type(command) is not ClosePath:
+                    args = command - pos
 
-    @override
-    def serialize(self) -> str:
-        return " ".join(self.__serialize_commands())
+                pos, subpath_start = _advance(command, pos, subpath_start)
+
+            implicit = allow_implicit and _can_use_implicit_command(
+                command, prev=prev
+            )
+            char, names = _COMMAND_SERIALIZATION[type(command)]
+
+            parts.append(
+                serialize.serialize_path_command(
+                    *[getattr(args, name) for name in names],
+                    char=char,
+                    implicit=implicit,
+                    formatter=formatter,
+                )
+            )
+            prev = command
+
+        return " ".join(parts)
 
     def resolve_shorthands(
         self, *, lines: bool = True, curves: bool = True
@@ -958,27 +1099,34 @@ class PathData(
         PathData(MoveTo(end=Point(x=0.0, y=0.0)))
 
         """
-        path_data = type(self)()
-
-        for i, command in enumerate(self):
-            match command:
-                case SmoothQuadraticBezierTo(end=end) if curves:
-                    control = _quadratic_control_at(self, i)
-                    path_data.quadratic_bezier_to(control, end)
-                case SmoothCubicBezierTo(control2=control2, end=end) if (
-                    curves
-                ):
-                    control1 = _cubic_control_at(self, i)
-                    path_data.cubic_bezier_to(control1, control2, end)
-                case HorizontalLineTo(x=x) if lines:
-                    end = _get_end_at(path_data, len(path_data) - 1)
-                    path_data.line_to(point.Point(x, end.y))
-                case VerticalLineTo(y=y) if lines:
-                    end = _get_end_at(path_data, len(path_data) - 1)
-                    path_data.line_to(point.Point(end.x, y))
-                case _:
-                    path_data.append(command)
-        return path_data
+        commands: list[PathCommand] = []
+        # the current point and the implied control points of smooth curves
+        # are tracked alongside the loop instead of being recomputed from
+        # the preceding commands
+        pos = subpath_start = quadratic = cubic = point.Point.zero()
+
+        for command in self:
+            resolved: PathCommand = command
+
+            # exact type checks, see `_advance()`
+            if type(command) is SmoothQuadraticBezierTo and curves:
+                resolved = QuadraticBezierTo(quadratic, command.end)
+            elif type(command) is SmoothCubicBezierTo and curves:
+                resolved = CubicBezierTo(
+                    cubic, command.control2, command.end
+                )
+            elif type(command) is HorizontalLineTo and lines:
+                resolved = LineTo(point.Point(command.x, pos.y))
+            elif type(command) is VerticalLineTo and lines:
+                resolved = LineTo(point.Point(pos.x, command.y))
+
+            commands.append(resolved)
+            pos, subpath_start = _advance(command, pos, subpath_start)
+            quadratic, cubic = _next_smooth_controls(
+                command, pos, quadratic
+            )
+
+        return type(self)(commands)
 
     def apply_shorthands(
         self, *, lines: bool = True, curves: bool = True
@@ -1002,53 +1150,42 @@ class PathData(
         PathData(MoveTo(end=Point(x=10.0, y=10.0)), HorizontalLineTo(x=100.0))
 
         """
-        path_data = type(self)()
+        commands: list[PathCommand] = []
+        pos = subpath_start = quadratic = cubic = point.Point.zero()
 
         for command in self:
-            match command:
-                case LineTo(end=end) if lines and end.x == (
-                    _get_end_at(path_data, len(path_data) - 1).x
-                ):
-                    path_data.vertical_line_to(end.y)
-                case LineTo(end=end) if lines and end.y == (
-                    _get_end_at(path_data, len(path_data) - 1).y
-                ):
-                    path_data.horizontal_line_to(end.x)
-                case QuadraticBezierTo(control=control, end=end) if curves:
-                    path_data.smooth_quadratic_bezier_to(end)
-
-                    shorthand = path_data[-1]
-                    assert isinstance(shorthand, SmoothQuadraticBezierTo)
-
-                    # try to replace the command with a shorthand
-                    auto_control = _quadratic_control_at(
-                        path_data, len(path_data) - 1
-                    )
-
-                    # if the shorthand turns out not to be compatible, revert
-                    # to the original command
-                    if control != auto_control:
-                        path_data[-1] = command
-
-                case CubicBezierTo(
-                    control1=control1, control2=control2, end=end
-                ) if curves:
-                    path_data.smooth_cubic_bezier_to(control2, end)
-
-                    shorthand = path_data[-1]
-                    assert isinstance(shorthand, SmoothCubicBezierTo)
-
-                    auto_control = _cubic_control_at(
-                        path_data, len(path_data) - 1
-                    )
-
-                    if control1 != auto_control:
-                        path_data[-1] = command
-
-                case _:
-                    path_data.append(command)
+            applied: PathCommand = command
+
+            # exact type checks, see `_advance()`
+            if lines and _is_line_to(command):
+                if command.end.x == pos.x:
+                    applied = VerticalLineTo(command.end.y)
+                elif command.end.y == pos.y:
+                    applied = HorizontalLineTo(command.end.x)
+            elif (
+                type(command) is QuadraticBezierTo
+                and curves
+                and command.control == quadratic
+            ):
+                applied = SmoothQuadraticBezierTo(command.end)
+            elif (
+                type(command) is CubicBezierTo
+                and curves
+                and command.control1 == cubic
+            ):
+                applied = SmoothCubicBezierTo(
+                    command.control2, command.end
+                )
+
+            commands.append(applied)
+            pos, subpath_start = _advance(command, pos, subpath_start)
+            # the implied control points follow the emitted commands, which
+            # is what a reader of the shorthand path reflects
+            quadratic, cubic = _next_smooth_controls(
+                applied, pos, quadratic
+            )
 
-        return path_data
+        return type(self)(commands)
 
     @overload
     def __getitem__(self, index: SupportsIndex) -> PathCommand: ...
@@ -1121,24 +1258,59 @@ class PathData(
     def __len__(self) -> int:
         return len(self.__commands)
 
+    @override
+    def __iter__(self) -> Iterator[PathCommand]:
+        return iter(self.__commands)
+
+    @override
+    def __reversed__(self) -> Iterator[PathCommand]:
+        return reversed(self.__commands)
+
+    @override
+    def __contains__(self, value: object) -> bool:
+        return value in self.__commands
+
     @override
     def __rmatmul__(self, other: transform.TransformFunction) -> Self:
-        return type(self)(
-            other @ command
-            if isinstance(command, _PhysicalPathCommand)
-            else command
-            for command in self
+        # transform all points of point-only commands in one go; the other
+        # commands have transform-specific logic and are handled one by one
+        transformed = iter(
+            _transform_points(
+                other,
+                [
+                    getattr(command, name)
+                    for command in self
+                    for name in _POINT_FIELDS.get(type(command), ())
+                ],
+            )
         )
 
+        commands: list[PathCommand] = []
+
+        for command in self:
+            if names := _POINT_FIELDS.get(type(command)):
+                # every point-only command takes its points positionally
+                build = cast("Callable[..., PathCommand]", type(command))
+                commands.append(build(*(next(transformed) for _ in names)))
+            elif type(command) is ClosePath:
+                commands.append(command)
+            else:
+                commands.append(other @ command)
+
+        return type(self)(commands)
+
     @override
     def __eq__(self, other: object) -> bool:
-        if not miscutils.basic_compare(other, self=self):
-            return False
+        # `miscutils.basic_compare()` inlined to save a call per comparison
+        if other is self:
+            return True
 
-        if len(self) != len(other):
+        if not isinstance(other, type(self)):
             return False
 
-        return all(c1 == c2 for c1, c2 in zip(self, other, strict=True))
+        # list equality checks the lengths first and then compares the
+        # commands pairwise in C
+        return self.__commands == other.__commands
 
     @override
     def __hash__(self) -> int:
@@ -1186,30 +1358,231 @@ class _Transformer(lark.Transformer[object, PathData]):
     def path(
         self, args: list[PathCommand | lark.Tree[PathCommand | lark.Token]]
     ) -> PathData:
-        path_data = PathData()
+        commands: list[PathCommand] = []
+        # the current point is tracked locally, so that relative commands
+        # can be resolved without walking back through the path
+        pos = subpath_start = point.Point.zero()
 
         for item in args:
             match item:
                 # simple commands like `Z` require no further processing
                 case _PathCommandBase() as command:
-                    _add_command(path_data, command)
+                    group = [command]
+                    relative = False
                 # commands that are part of a group need to be extracted;
                 # the relative flag is applied if the group is relative
-                case lark.Tree(data=name, children=commands):
+                case lark.Tree(data=name, children=group):
                     # sanity check for when the grammar changes
                     assert "relative" in name or "absolute" in name
                     relative = "relative" in name
 
-                    for command in commands:
-                        assert isinstance(command, PathCommand)
-                        _add_command(path_data, command, relative=relative)
+            for parsed in group:
+                assert isinstance(parsed, PathCommand)
 
-        return path_data
+                command = (
+                    parsed + pos
+                    if relative and type(parsed) is not ClosePath
+                    else parsed
+                )
+                pos, subpath_start = _advance(command, pos, subpath_start)
+                commands.append(command)
+
+        return PathData(commands)
+
+
+# the transformer is stateless, so a single instance can be shared
+_TRANSFORMER: Final = _Transformer()
+
+
+# the scanner mirrors the terminals of `path_data.lark`: `WS`, `NUMBER` (i.e.,
+# `SIGNED_NUMBER` from the Lark common library) and `FLAG`
+_WS: Final = "[ \t\f\r\n]*"
+_NUMBER: Final = (
+    r"[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[eE][+-]?[0-9]+)?"
+)
+_NUMBER_RE: Final = re.compile(rf"{_WS}(,?){_WS}({_NUMBER})")
+_FLAG_RE: Final = re.compile(rf"{_WS}(,?){_WS}([01])")
+_COMMAND_RE: Final = re.compile(rf"{_WS}([MmLlHhVvCcSsQqTtAaZz])")
+_END_RE: Final = re.compile(rf"{_WS}\Z")
+
+_SCANNER_ARGS: Final[dict[str, str]] = {
+    "M": "nn",
+    "L": "nn",
+    "H": "n",
+    "V": "n",
+    "C": "nnnnnn",
+    "S": "nnnn",
+    "Q": "nnnn",
+    "T": "nn",
+    "A": "nnnffnn",
+    "Z": "",
+}
+"""Argument kinds of path commands, `n` for numbers and `f` for flags."""
+
+_SCANNER_BUILDERS: Final[
+    dict[str, Callable[[list[float]], PathCommand]]
+] = {
+    "M": lambda v: MoveTo(point.Point(v[0], v[1])),
+    "L": lambda v: LineTo(point.Point(v[0], v[1])),
+    "H": lambda v: HorizontalLineTo(v[0]),
+    "V": lambda v: VerticalLineTo(v[0]),
+    "C": lambda v: CubicBezierTo(
+        point.Point(v[0], v[1]),
+        point.Point(v[2], v[3]),
+        point.Point(v[4], v[5]),
+    ),
+    "S": lambda v: SmoothCubicBezierTo(
+        point.Point(v[0], v[1]), point.Point(v[2], v[3])
+    ),
+    "Q": lambda v: QuadraticBezierTo(
+        point.Point(v[0], v[1]), point.Point(v[2], v[3])
+    ),
+    "T": lambda v: SmoothQuadraticBezierTo(point.Point(v[0], v[1])),
+    "A": lambda v: ArcTo(
+        radii=point.Point(v[0], v[1]),
+        angle=v[2],
+        large=bool(v[3]),
+        sweep=bool(v[4]),
+        end=point.Point(v[5], v[6]),
+    ),
+    "Z": lambda _: ClosePath(),
+}
+
+
+def _scan(text: str) -> PathData | None:
+    """Parse path data with a hand-written scanner.
+
+    The scanner accepts exactly the language of `path_data.lark`, but it is
+    much faster than the Lark parser. It does not report errors; if the text
+    is not valid path data, `None` is returned and the grammar can be used to
+    obtain a proper error message.
+
+    Args:
+        text: The string to parse.
+
+    Returns:
+        The parsed path data, or `None` if the text could not be scanned.
+
+    Examples:
+    >>> path_data = _scan("M 10,10 h5-5")
+    >>> path_data[0]
+    MoveTo(end=Point(x=10.0, y=10.0))
+    >>> path_data[1]
+    HorizontalLineTo(x=15.0)
+    >>> path_data[2]
+    HorizontalLineTo(x=10.0)
+    >>> _scan("M 10,10 L") is None
+    True
+
+    """
+    commands: list[PathCommand] = []
+    pos = subpath_start = point.Point.zero()
+    idx = 0
+
+    while (command_match := _COMMAND_RE.match(text, idx)) is not None:
+        idx = command_match.end()
+        char = command_match.group(1)
+        name = char.upper()
+
+        if not commands and name != "M":
+            return None
+
+        args = _SCANNER_ARGS[name]
+        relative = char != name
+        first = True
+
+        # a command letter may be followed by several argument groups; the
+        # first group may not start with a comma and must be present, unless
+        # the command has no arguments at all
+        while True:
+            values: list[float] = []
+            group_idx = idx
+
+            for kind in args:
+                regex = _FLAG_RE if kind == "f" else _NUMBER_RE
+                arg_match = regex.match(text, group_idx)
+
+                if arg_match is None or (
+                    first and not values and arg_match.group(1)
+                ):
+                    break
+
+                value = float(arg_match.group(2))
+
+                if not math.isfinite(value):
+                    return None
+
+                values.append(value)
+                group_idx = arg_match.end()
+
+            if len(values) != len(args):
+                if first or values:
+                    return None
+
+                break
+
+            idx = group_idx
+            # additional argument groups of a move are treated as lines
+            builder = _SCANNER_BUILDERS[
+                "L" if name == "M" and not first else name
+            ]
+            command = builder(values)
+
+            if relative and type(command) is not ClosePath:
+                command += pos
+
+            pos, subpath_start = _advance(command, pos, subpath_start)
+            commands.append(command)
+
+            if not args:
+                break
+
+            first = False
+
+    if _END_RE.match(text, idx) is None:
+        return None
+
+    return PathData(commands)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_commands(text: str) -> tuple[PathCommand, ...]:
+    """Parse path data into a tuple of commands.
+
+    Documents often repeat the same path data (icons, glyphs, markers), so
+    the results are cached. Commands are immutable, which makes it safe to
+    share them between `PathData` instances.
+
+    Args:
+        text: The path data to parse.
+
+    Returns:
+        The parsed commands.
+
+    Raises:
+        ValueError: If the text is not valid path data.
+
+    """
+    path_data = _scan(text)
+
+    # the scanner does not explain why it rejected the text, so the
+    # grammar is used to produce a meaningful error
+    if path_data is None:
+        path_data = parse.parse(
+            text, grammar="path_data.lark", transformer=_TRANSFORMER
+        )
+
+    return tuple(path_data)
 
 
 PathDataType: TypeAlias = Annotated[
     PathData,
+    # `from_str()` goes through the cache of parsed commands, so repeated
+    # path data in a document is only parsed once; invalid path data is
+    # still reported by the grammar inside `_parse_commands()`
     parse.get_validator(
-        grammar="path_data.lark", transformer=_Transformer()
+        grammar="path_data.lark",
+        transformer=_TRANSFORMER,
+        fast_path=PathData.from_str,
     ),
 ]
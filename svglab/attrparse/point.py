@@ -10,6 +10,7 @@ fields.
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Iterator
 
 import lark
@@ -24,7 +25,7 @@ from typing_extensions import (
 
 from svglab import mixins, models, protocols, serialize
 from svglab.attrparse import parse, transform
-from svglab.utils import mathutils, miscutils
+from svglab.utils import mathutils
 
 
 @models.dataclass(frozen=True, config=models.DATACLASS_CONFIG)
@@ -52,7 +53,9 @@ class _Point(
         return cls(value.real, value.imag)
 
     @classmethod
+    @functools.cache
     def zero(cls) -> Self:
+        # points are immutable, so a single instance can be shared
         return cls(0, 0)
 
     def line_reflect(self, center: Self) -> Self:
@@ -76,7 +79,11 @@ class _Point(
         Point(x=20.0, y=20.0)
 
         """
-        return center + (center - self)
+        # plain float arithmetic, equivalent to `center + (center - self)`
+        # without building two translation matrices
+        return type(self)(
+            center.x + (center.x - self.x), center.y + (center.y - self.y)
+        )
 
     def __iter__(self) -> Iterator[float]:
         yield self.x
@@ -87,6 +94,11 @@ class _Point(
         return type(self)(self.x * scalar, self.y * scalar)
 
     def __rmatmul__(self, other: transform.TransformFunction) -> Self:
+        # translation is what `+` and `-` go through, so it skips building
+        # the equivalent matrix
+        if type(other) is transform.Translate:
+            return type(self)(self.x + other.tx, self.y + other.ty)
+
         a, b, c, d, e, f = other.to_matrix().to_tuple()
 
         x = a * self.x + c * self.y + e
@@ -96,7 +108,11 @@ class _Point(
 
     @override
     def __eq__(self, other: object) -> bool:
-        if not miscutils.basic_compare(other, self=self):
+        # `miscutils.basic_compare()` inlined, points are compared often
+        if other is self:
+            return True
+
+        if not isinstance(other, type(self)):
             return False
 
         return mathutils.is_close(self.x, other.x) and mathutils.is_close(
@@ -156,7 +172,11 @@ class Point(_Point):
         y: protocols.SupportsFloatOrIndex,
         /,
     ) -> None:
-        super().__init__(float(x), float(y))
+        # float() already guarantees the field types, which makes Pydantic's
+        # validation a no-op, so the fields are set directly; points are
+        # created for every coordinate of every path command
+        object.__setattr__(self, "x", float(x))
+        object.__setattr__(self, "y", float(y))
 
 
 @lark.v_args(inline=True)
@@ -167,5 +187,7 @@ class _Transformer(lark.Transformer[object, Point]):
 
 PointType: TypeAlias = Annotated[
     Point,
-    parse.get_validator(grammar="point.lark", transformer=_Transformer()),
+    parse.get_validator(
+        grammar="point.lark", transformer=_Transformer(), cache=True
+    ),
 ]
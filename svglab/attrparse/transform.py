@@ -715,6 +715,8 @@ class PointAddSubWithTranslateRMatmul(
 ):
     """Implement moving by a vector using multiplication with `Translate`."""
 
+    __slots__ = ()
+
     @override
     def __add__(self, other: protocols.PointLike, /) -> Self:
         return Translate(other.x, other.y) @ self
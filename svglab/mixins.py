@@ -37,6 +37,8 @@ class CustomModel(protocols.PydanticCompatible, metaclass=abc.ABCMeta):
     automatically and should not be overridden.
     """
 
+    __slots__ = ()
+
     @classmethod
     @abc.abstractmethod
     def _validate(
@@ -65,6 +67,8 @@ class SubWithNeg(
 ):
     """Implement subtraction using negation and addition."""
 
+    __slots__ = ()
+
     @override
     def __sub__(self, other: _SupportsNegT_contra, /) -> Self:
         return self + -other
@@ -77,6 +81,8 @@ class RAddWithAdd(
 ):
     """Implement right addition using addition."""
 
+    __slots__ = ()
+
     @override
     def __radd__(self, other: _T_contra, /) -> Self:
         return self + other
@@ -89,6 +95,8 @@ class RSubWithSub(
 ):
     """Implement right subtraction using subtraction."""
 
+    __slots__ = ()
+
     @override
     def __rsub__(self, other: _T_contra, /) -> Self:
         return self - other
@@ -101,6 +109,8 @@ class RMulWithMul(
 ):
     """Implement right multiplication using multiplication."""
 
+    __slots__ = ()
+
     @override
     def __rmul__(self, other: _T_contra, /) -> Self:
         return self * other
@@ -113,6 +123,8 @@ class RTruedivWithTrueDiv(
 ):
     """Implement right true division using true division."""
 
+    __slots__ = ()
+
     @override
     def __rtruediv__(self, other: _T_contra, /) -> Self:
         return self / other
@@ -125,6 +137,8 @@ class NegWithMul(
 ):
     """Implement negation using multiplication by -1."""
 
+    __slots__ = ()
+
     @override
     def __neg__(self) -> Self:
         return self * -1
@@ -137,6 +151,8 @@ class TrueDivWithMul(
 ):
     """Implement true division using multiplication by the reciprocal."""
 
+    __slots__ = ()
+
     @override
     def __truediv__(self, other: _SupportsRTrueDivT_contra, /) -> Self:
         return self * (1 / other)
@@ -151,6 +167,8 @@ class FloatMulDiv(
 ):
     """Implement multiplication and division as effortlessly as possible."""
 
+    __slots__ = ()
+
 
 class AddSub(
     SubWithNeg[_SupportsNegT_contra],
@@ -159,3 +177,5 @@ class AddSub(
     metaclass=abc.ABCMeta,
 ):
     """Implement addition and subtraction as effortlessly as possible."""
+
+    __slots__ = ()
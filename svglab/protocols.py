@@ -34,6 +34,8 @@ class CustomSerializable(Protocol):
     used to obtain the string representation, instead of using `str()`.
     """
 
+    __slots__ = ()
+
     def serialize(self) -> str:
         """Return an SVG-friendly string representation of this object."""
         ...
@@ -43,6 +45,8 @@ class CustomSerializable(Protocol):
 class PydanticCompatible(Protocol):
     """A protocol for classes that can be used as pydantic models."""
 
+    __slots__ = ()
+
     @classmethod
     def __get_pydantic_core_schema__(
         cls, source_type: type, handler: pydantic.GetCoreSchemaHandler
@@ -51,64 +55,90 @@ class PydanticCompatible(Protocol):
 
 @runtime_checkable
 class SupportsRead(Protocol[_AnyStr_co]):
+    __slots__ = ()
+
     def read(self, size: int | None = None, /) -> _AnyStr_co: ...
 
 
 @runtime_checkable
 class SupportsWrite(Protocol[_AnyStr_contra]):
+    __slots__ = ()
+
     def write(self, data: _AnyStr_contra, /) -> int: ...
 
 
 @runtime_checkable
 class SupportsAdd(Protocol[_T_contra]):
+    __slots__ = ()
+
     def __add__(self, other: _T_contra, /) -> Self: ...
 
 
 @runtime_checkable
 class SupportsRAdd(Protocol[_T_contra]):
+    __slots__ = ()
+
     def __radd__(self, other: _T_contra, /) -> Self: ...
 
 
 @runtime_checkable
 class SupportsSub(Protocol[_T_contra]):
+    __slots__ = ()
+
     def __sub__(self, other: _T_contra, /) -> Self: ...
 
 
 @runtime_checkable
 class SupportsRSub(Protocol[_T_contra]):
+    __slots__ = ()
+
     def __rsub__(self, other: _T_contra, /) -> Self: ...
 
 
 @runtime_checkable
 class SupportsMul(Protocol[_T_contra]):
+    __slots__ = ()
+
     def __mul__(self, other: _T_contra, /) -> Self: ...
 
 
 @runtime_checkable
 class SupportsRMul(Protocol[_T_contra]):
+    __slots__ = ()
+
     def __rmul__(self, other: _T_contra, /) -> Self: ...
 
 
 @runtime_checkable
 class SupportsTrueDiv(Protocol[_T_contra]):
+    __slots__ = ()
+
     def __truediv__(self, other: _T_contra, /) -> Self: ...
 
 
 class SupportsRTrueDiv(Protocol[_T_contra]):
+    __slots__ = ()
+
     def __rtruediv__(self, other: _T_contra, /) -> Self: ...
 
 
 @runtime_checkable
 class SupportsRMatmul(Protocol[_T_contra]):
+    __slots__ = ()
+
     def __rmatmul__(self, other: _T_contra, /) -> Self: ...
 
 
 @runtime_checkable
 class SupportsNeg(Protocol):
+    __slots__ = ()
+
     def __neg__(self) -> Self: ...
 
 
 @runtime_checkable
 class PointLike(SupportsNeg, Protocol):
+    __slots__ = ()
+
     x: float
     y: float
@@ -52,6 +52,14 @@ _PrecisionGroup: TypeAlias = Literal[
     "general", "coordinate", "opacity", "angle", "scale"
 ]
 
+_PRECISION_ATTRS: Final[Mapping[_PrecisionGroup, str]] = {
+    "general": "general_precision",
+    "coordinate": "coordinate_precision",
+    "opacity": "opacity_precision",
+    "angle": "angle_precision",
+    "scale": "scale_precision",
+}
+
 
 @models.dataclass(
     frozen=True,
@@ -131,7 +139,7 @@ class FloatPrecisionSettings:
         return self
 
     @functools.cached_property
-    def __sorted_precision_table(self) -> Iterable[PrecisionInterval]:
+    def __sorted_precision_table(self) -> Sequence[PrecisionInterval]:
         return sorted(
             self.precision_table, key=lambda interval: interval.start
         )
@@ -146,10 +154,15 @@ class FloatPrecisionSettings:
             The number of decimal places to use when serializing the number.
 
         """
+        table = self.__sorted_precision_table
+
+        if not table:
+            return self.fallback
+
         return next(
             (
                 interval.precision
-                for interval in self.__sorted_precision_table
+                for interval in table
                 if interval.start <= abs(value) < interval.end
             ),
             self.fallback,
@@ -387,17 +400,12 @@ class Formatter:
             The number of decimal places to use when serializing the number.
 
         """
-        settings: _FloatPrecisionSettingsType = None
-
-        for group in precision_group, "general":
-            name = f"{group}_precision"
+        settings: _FloatPrecisionSettingsType = getattr(
+            self, _PRECISION_ATTRS[precision_group]
+        )
 
-            if (
-                hasattr(self, name)
-                and (attr := getattr(self, name)) is not None
-            ):
-                settings = attr
-                break
+        if settings is None:
+            settings = self.general_precision
 
         if settings is None:
             msg = (
@@ -466,13 +474,19 @@ def set_formatter(formatter: Formatter, /) -> None:
 
 
 def _serialize_number(
-    number: float, /, *, precision_group: _PrecisionGroup = "general"
+    number: float,
+    /,
+    *,
+    precision_group: _PrecisionGroup = "general",
+    formatter: Formatter | None = None,
 ) -> str:
     """Format a number into a string based on current formatter settings.
 
     Args:
     number: The number to format.
     precision_group: The precision group to use when formatting the number.
+    formatter: The current formatter, if the caller has already looked it
+    up. If `None`, it is looked up here.
 
     Returns:
     The formatted number as a string.
@@ -494,7 +508,8 @@ def _serialize_number(
     '1e-07'
 
     """
-    formatter = get_current_formatter()
+    if formatter is None:
+        formatter = get_current_formatter()
 
     # make sure the number is always a float and not an int, so that str()
     # always includes the decimal point
@@ -585,15 +600,26 @@ def _serialize(
     *,
     bool_mode: _BoolMode,
     precision_group: _PrecisionGroup,
+    formatter: Formatter | None = None,
 ) -> str:
-    formatter = get_current_formatter()
+    # plain numbers make up the bulk of serialized values (coordinates in
+    # path data, point lists, etc.), so skip the dispatch below for them
+    if type(value) is float or type(value) is int:
+        return _serialize_number(
+            value, precision_group=precision_group, formatter=formatter
+        )
+    if type(value) is bool:
+        return _serialize_bool(value, mode=bool_mode)
+
+    if formatter is None:
+        formatter = get_current_formatter()
+
     result: str
 
     match value:
         # `isinstance()` on a runtime-checkable Protocol is slow
         case _ if callable(getattr(value, "serialize", None)):
             result = cast(protocols.CustomSerializable, value).serialize()
-            formatter = get_current_formatter()
 
             if (
                 formatter.spaces_around_function_args
@@ -611,7 +637,7 @@ def _serialize(
             result = _serialize_bool(value, mode=bool_mode)
         case int() | float():
             result = _serialize_number(
-                value, precision_group=precision_group
+                value, precision_group=precision_group, formatter=formatter
             )
         case str():
             result = value
@@ -619,10 +645,12 @@ def _serialize(
             result = value.decode()
         # this should go last to avoid classifying strings as iterables, etc.
         case Iterable():
-            formatter = get_current_formatter()
             result = formatter.list_separator.join(
                 _serialize(
-                    v, bool_mode=bool_mode, precision_group=precision_group
+                    v,
+                    bool_mode=bool_mode,
+                    precision_group=precision_group,
+                    formatter=formatter,
                 )
                 for v in value
             )
@@ -739,10 +767,17 @@ def serialize_function_call(
     return f"{name}({args_str})"
 
 
+_RELATIVE_PATH_COMMAND_CHARS: Final = {
+    char: char.lower() for char in "MLHVCSQTAZ"
+}
+"""Lowercase (relative) forms of the path command characters."""
+
+
 def serialize_path_command(
     *args: object,
     char: Literal["M", "L", "H", "V", "C", "S", "Q", "T", "A", "Z"],
     implicit: bool,
+    formatter: Formatter | None = None,
 ) -> str:
     """Serialize a path command.
 
@@ -751,6 +786,12 @@ def serialize_path_command(
         char: The command character, in uppercase.
         implicit: Whether the command is implicit (i.e., the command character
         is omitted).
+        formatter: The current formatter, if the caller has already looked it
+        up; this saves looking it up for every command of a path and every
+        number. It must be the formatter returned by
+        `get_current_formatter()`, because arguments with their own
+        `serialize()` method (such as points) always use the current
+        formatter. If `None`, the current formatter is looked up.
 
     Returns:
         The serialized command.
@@ -763,21 +804,35 @@ def serialize_path_command(
     '100,100'
 
     """
-    formatter = get_current_formatter()
-    parts: list[str] = []
+    if formatter is None:
+        formatter = get_current_formatter()
 
-    if not implicit:
-        cmd = (
-            char
-            if formatter.path_data_coordinates == "absolute"
-            else char.lower()
-        )
-        parts.append(cmd)
+    # join the arguments directly instead of passing the tuple through
+    # serialize(), which would dispatch on it and wrap the result
+    args_str = formatter.list_separator.join(
+        [
+            _serialize(
+                arg,
+                bool_mode="number",
+                precision_group="general",
+                formatter=formatter,
+            )
+            for arg in args
+        ]
+    )
+
+    if implicit:
+        return args_str
+
+    cmd = (
+        char
+        if formatter.path_data_coordinates == "absolute"
+        else _RELATIVE_PATH_COMMAND_CHARS[char]
+    )
 
-    if args:
-        args_str = serialize(args, bool_mode="number")
-        parts.append(args_str)
+    if not args_str:
+        return cmd
 
     sep = " " if formatter.path_data_space_before_args else ""
 
-    return sep.join(parts)
+    return cmd + sep + args_str
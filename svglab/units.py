@@ -106,8 +106,9 @@ def make_converter(
         A converter function that can convert between units. The function
         accepts an object with a `value` and `unit` attribute, and a target
         unit. It returns a new object with the converted value and unit.
-        If the conversion is not possible,
-        a `SvgUnitConversionError` is raised.
+        If the object already has the target unit, the object itself is
+        returned; this relies on the objects being immutable. If the
+        conversion is not possible, a `SvgUnitConversionError` is raised.
 
     """
     graph = _table_to_graph(conversion_table)
@@ -119,6 +120,10 @@ def make_converter(
         return _get_conversion_rate(source, target, graph=graph)
 
     def convert(obj: _HasUnitT, unit: _UnitT_co) -> _HasUnitT:
+        # the objects are immutable, so there is no need to copy them
+        if obj.unit == unit:
+            return obj
+
         conversion_rate: float | None = get_conversion_rate(obj.unit, unit)
 
         if conversion_rate is None:
@@ -0,0 +1,19 @@
+import pydantic
+import pytest
+
+import svglab
+
+
+@pytest.mark.parametrize(
+    ("value", "unit"), [(True, None), ("1", None), (1, "xx"), (1, ["px"])]
+)
+def test_length_init_validates(value: object, unit: object) -> None:
+    with pytest.raises(pydantic.ValidationError):
+        svglab.Length(value, unit)  # pyright: ignore[reportArgumentType]
+
+
+def test_length_init_converts_int() -> None:
+    length = svglab.Length(10, "cm")
+
+    assert type(length.value) is float
+    assert length == svglab.Length(value=10.0, unit="cm")
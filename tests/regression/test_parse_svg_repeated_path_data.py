@@ -0,0 +1,19 @@
+import svglab
+
+
+def test_parse_svg_repeated_path_data() -> None:
+    svg = svglab.parse_svg("""
+        <svg>
+            <path d="M 0,0 L 10,10 Z"/>
+            <path d="M 0,0 L 10,10 Z"/>
+        </svg>
+    """)
+
+    first, second = (path.d for path in svg.find_all(svglab.Path))
+    assert first is not None
+    assert second is not None
+
+    first.append(svglab.MoveTo(svglab.Point(5, 5)))
+
+    assert first is not second
+    assert second == svglab.PathData.from_str("M 0,0 L 10,10 Z")
@@ -0,0 +1,13 @@
+import svglab
+
+
+def test_path_data_from_str_independent() -> None:
+    text = "M 0,0 L 10,10 Z"
+
+    first = svglab.PathData.from_str(text)
+    second = svglab.PathData.from_str(text)
+    first.append(svglab.MoveTo(end=svglab.Point(5, 5)))
+
+    assert first is not second
+    assert second == svglab.PathData.from_str(text)
+    assert len(second) == 3
@@ -0,0 +1,53 @@
+import svglab
+
+
+class _MyLine(svglab.LineTo):
+    pass
+
+
+def test_path_data_line_to_subclass_serialize() -> None:
+    path_data = svglab.PathData(
+        [
+            svglab.MoveTo(svglab.Point(0, 0)),
+            svglab.LineTo(svglab.Point(1, 1)),
+            _MyLine(svglab.Point(2, 2)),
+        ]
+    )
+
+    assert path_data.serialize() == "M0,0 1,1 L2,2"
+
+
+def test_path_data_line_to_subclass_transform() -> None:
+    line = _MyLine(svglab.Point(2, 2))
+    path_data = svglab.PathData([svglab.MoveTo(svglab.Point(0, 0)), line])
+
+    assert line + svglab.Point(1, 1) == _MyLine(svglab.Point(3, 3))
+    assert svglab.Translate(1, 1) @ path_data == svglab.PathData(
+        [svglab.MoveTo(svglab.Point(1, 1)), _MyLine(svglab.Point(3, 3))]
+    )
+
+
+def test_path_data_line_to_subclass_implicit() -> None:
+    path_data = svglab.PathData(
+        [svglab.MoveTo(svglab.Point(0, 0)), _MyLine(svglab.Point(1, 1))]
+    )
+
+    assert path_data.serialize() == "M0,0 1,1"
+
+
+def test_path_data_line_to_subclass_apply_shorthands() -> None:
+    path_data = svglab.PathData(
+        [
+            svglab.MoveTo(svglab.Point(0, 0)),
+            _MyLine(svglab.Point(5, 0)),
+            _MyLine(svglab.Point(5, 5)),
+        ]
+    )
+
+    assert path_data.apply_shorthands() == svglab.PathData(
+        [
+            svglab.MoveTo(svglab.Point(0, 0)),
+            svglab.HorizontalLineTo(5.0),
+            svglab.VerticalLineTo(5.0),
+        ]
+    )
@@ -0,0 +1,13 @@
+import sys
+
+import svglab
+
+
+def test_path_data_long_shorthand_chain() -> None:
+    # long enough to exceed the recursion limit if end points are resolved
+    # recursively
+    count = sys.getrecursionlimit() // 2 + 1
+    path_data = svglab.PathData.from_str("m0,0" + " h1 v1" * count)
+
+    assert len(path_data) == 2 * count + 1
+    assert path_data[-1] == svglab.VerticalLineTo(y=count)
@@ -0,0 +1,18 @@
+import sys
+
+import svglab
+
+
+def test_path_data_long_smooth_curve_chain() -> None:
+    # long enough to exceed the recursion limit if control points are
+    # resolved recursively
+    count = sys.getrecursionlimit() + 1
+    path_data = svglab.PathData.from_str("M0,0 Q0,1 1,1" + " t1,0" * count)
+
+    resolved = path_data.resolve_shorthands()
+
+    assert len(resolved) == count + 2
+    assert resolved[-1] == svglab.QuadraticBezierTo(
+        control=svglab.Point(count + count % 2, 1),
+        end=svglab.Point(count + 1, 1),
+    )
@@ -59,7 +59,9 @@ def test_valid_length(value: float) -> None:
         assert rect.width == svglab.Length(value, unit)
 
 
-@pytest.mark.parametrize("value", ["", "foo", "px", "1.2."])
+@pytest.mark.parametrize(
+    "value", ["", "foo", "px", "1.2.", "1e", "1e999", "10pxx", "1 e1"]
+)
 def test_invalid_length(value: str) -> None:
     xml = f"<svg><rect width='{value}'/></svg>"
 
@@ -769,12 +771,43 @@ def test_resolve_iri_and_reference_detection() -> None:
             .close()
             .horizontal_line_to(100),
         ),
+        (
+            "m.5.5-1-1e1zl1.,+2",
+            svglab.PathData()
+            .move_to(svglab.Point(0.5, 0.5))
+            .line_to(svglab.Point(-0.5, -9.5))
+            .close()
+            .line_to(svglab.Point(1.5, 2.5)),
+        ),
     ],
 )
 def test_path_data_parse(text: str, expected: str) -> None:
     assert svglab.PathData.from_str(text) == expected
 
 
+@pytest.mark.parametrize(
+    "text",
+    [
+        "M",
+        "M 10",
+        "M,10,10",
+        "M 10,10,",
+        "M 10,10 L",
+        "M 10,10 L 20",
+        "M 10,10 ,L 20,20",
+        "M 10,10 Z 20",
+        "M 10,10 A 1,1 0 2 0 5,5",
+        "M 1e400,0",
+        "M 1e,0",
+        "M 10,,10",
+        "M 10,10 X",
+    ],
+)
+def test_path_data_parse_invalid(text: str) -> None:
+    with pytest.raises(ValueError, match=r"path_data.lark"):
+        svglab.PathData.from_str(text)
+
+
 def test_path_data_parse_moveto_must_be_first() -> None:
     with pytest.raises(
         ValueError,
@@ -894,6 +927,25 @@ def test_path_data_parse_serialize(text: str, expected: str) -> None:
     assert svglab.PathData.from_str(text).serialize() == expected
 
 
+@pytest.mark.parametrize(
+    "text",
+    [
+        "m10,10 h100 v100 l10,10 10,10 z m5,5 h10 z",
+        "m0,0 c10,10 20,20 30,30 s10,10 20,20 q10,10 20,20 t10,10",
+        "m12,22 a10,10 0 1 1 0,-20 10,10 0 0 1 0,20 z",
+    ],
+)
+def test_path_data_serialize_relative(text: str) -> None:
+    formatter = svglab.Formatter(
+        path_data_coordinates="relative",
+        path_data_shorthand_curve_commands="original",
+        path_data_shorthand_line_commands="original",
+    )
+
+    with formatter:
+        assert svglab.PathData.from_str(text).serialize() == text
+
+
 def test_path_data_first_command_is_move_to() -> None:
     with pytest.raises(svglab.SvgPathMissingMoveToError):
         svglab.PathData().line_to(svglab.Point(0, 0))
@@ -917,6 +969,15 @@ def test_path_data_first_command_is_move_to() -> None:
     with pytest.raises(svglab.SvgPathMissingMoveToError):
         svglab.PathData().append(line_to)
 
+    with pytest.raises(svglab.SvgPathMissingMoveToError):
+        svglab.PathData([line_to])
+
+    with pytest.raises(svglab.SvgPathMissingMoveToError):
+        svglab.PathData().extend([line_to])
+
+    with pytest.raises(svglab.SvgPathMissingMoveToError):
+        path[1:]
+
 
 @pytest.mark.parametrize(
     ("transforms", "before", "after"),
@@ -1498,6 +1559,10 @@ def test_large_float_results_in_error() -> None:
         (svglab.RawText("test"), svglab.RawText("test")),
         (svglab.Comment("test"), svglab.Comment("test")),
         (svglab.CData("test"), svglab.CData("test")),
+        (
+            svglab.Path(d=svglab.PathData.from_str("M 0,0 L 10,10 Z")),
+            svglab.Path(d=svglab.PathData.from_str("M 0,0 L 10,10 Z")),
+        ),
         (
             svglab.Svg(
                 width=svglab.Length(100), height=svglab.Length(100)